@@ -3,6 +3,8 @@ Text to Excel Converter - Streamlit Application
 Converts unstructured text data into structured Excel spreadsheets
 """
 
+import asyncio
+import io
 import streamlit as st
 import pandas as pd
 from io import BytesIO
@@ -10,8 +12,11 @@ from datetime import datetime
 
 # Import custom modules
 from utils.text_extractor import extract_text_from_file
-from utils.parser import parse_key_value_pairs
-from utils.excel_generator import generate_excel
+from utils.parser import aparse_key_value_pairs
+from utils.excel_generator import generate_excel, generate_excel_fast
+
+# Above this row count, exports go through the PyExcelerate fast path
+FAST_EXPORT_THRESHOLD = 2000
 
 # Page configuration
 st.set_page_config(
@@ -20,6 +25,46 @@ st.set_page_config(
     layout="wide"
 )
 
+@st.cache_data(show_spinner=False)
+def _extract_cached(name: str, data: bytes) -> str:
+    """Memoized text extraction - Streamlit reruns with the same upload
+    (e.g. after editing the custom keys box) skip decode and parsing"""
+    buffer = io.BytesIO(data)
+    buffer.name = name  # extract_text_from_file dispatches on file.name
+    return extract_text_from_file(buffer)
+
+async def _process_one(file, file_idx, api_key, custom_keys):
+    """Extract and parse a single uploaded file, returning its column lists"""
+    # Generate doc_id (D1, D2, D3, etc.)
+    doc_id = f"D{file_idx}"
+
+    # Extract text (cached on file name + content across reruns)
+    text = _extract_cached(file.name, file.getvalue())
+
+    # Parse key-value pairs using Gemini LLM with doc_id
+    keys, values, comments = await aparse_key_value_pairs(text, api_key, custom_keys, "Gemini LLM", doc_id)
+
+    # Source file column parallels the extracted rows
+    return keys, values, comments, [file.name] * len(keys)
+
+async def _process_all(files, api_key, custom_keys):
+    """Process all uploaded files concurrently - Gemini calls are I/O bound"""
+    results = await asyncio.gather(*[
+        _process_one(file, file_idx, api_key, custom_keys)
+        for file_idx, file in enumerate(files, start=1)
+    ])
+
+    # Concatenate per-file column lists - pandas consumes these directly
+    # without an intermediate list-of-dicts pass
+    keys, values, comments, sources = [], [], [], []
+    for file_keys, file_values, file_comments, file_sources in results:
+        keys.extend(file_keys)
+        values.extend(file_values)
+        comments.extend(file_comments)
+        sources.extend(file_sources)
+
+    return keys, values, comments, sources
+
 def main():
     st.title("📊 Text to Excel Converter")
     st.markdown("---")
@@ -76,32 +121,19 @@ def main():
             elif st.button("🚀 Extract Data", type="primary", use_container_width=True):
                 with st.spinner("Processing files with Gemini LLM..."):
                     try:
-                        # Process files
-                        all_data = []
-                        
-                        for file_idx, file in enumerate(uploaded_files, start=1):
-                            # Generate doc_id (D1, D2, D3, etc.)
-                            doc_id = f"D{file_idx}"
-                            
-                            # Extract text
-                            text = extract_text_from_file(file)
-                            
-                            # Parse key-value pairs using Gemini LLM with doc_id
-                            keys_list = [k.strip() for k in custom_keys.split('\n') if k.strip()] if custom_keys else None
-                            rows = parse_key_value_pairs(text, api_key, keys_list, "Gemini LLM", doc_id)
-                            
-                            # Add source file to each row
-                            for row in rows:
-                                row['source_file'] = file.name
-                                all_data.append(row)
-                        
-                        # Create DataFrame with required columns: key, value, comments
-                        df = pd.DataFrame(all_data)
-                        
-                        # Reorder columns to ensure key, value, comments come first
-                        cols = ['key', 'value', 'comments', 'source_file']
-                        df = df[[c for c in cols if c in df.columns]]
-                        
+                        # Process all files concurrently
+                        keys_list = [k.strip() for k in custom_keys.split('\n') if k.strip()] if custom_keys else None
+                        keys, values, comments, sources = asyncio.run(_process_all(uploaded_files, api_key, keys_list))
+
+                        # Build the DataFrame once from column lists - columns
+                        # are already in the required order
+                        df = pd.DataFrame({
+                            'key': keys,
+                            'value': values,
+                            'comments': comments,
+                            'source_file': sources
+                        }, copy=False)
+
                         # Store in session state
                         st.session_state['extracted_data'] = df
                         st.session_state['processed'] = True
@@ -138,8 +170,9 @@ def main():
             st.subheader("💾 Export Data")
         
         with col2:
-            # Export to Excel
-            excel_buffer = generate_excel(edited_df, include_header, auto_width)
+            # Export to Excel - large frames use the PyExcelerate fast path
+            exporter = generate_excel_fast if len(edited_df) > FAST_EXPORT_THRESHOLD else generate_excel
+            excel_buffer = exporter(edited_df, include_header, auto_width)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
             st.download_button(
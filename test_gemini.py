@@ -0,0 +1,54 @@
+"""
+Manual smoke test / benchmark for the Gemini extraction pipeline
+Requires a real API key: set GEMINI_API_KEY and run `python test_gemini.py`
+Compares the serial and concurrent extraction paths so speedups from the
+chunk fan-out are visible in wall-clock numbers
+"""
+
+import os
+import sys
+import time
+
+from utils.parser import parse_key_value_pairs, parse_key_value_pairs_concurrent
+
+
+TEST_TEXT = """
+John Smith was born on March 15, 1985 in Portland, Oregon. He graduated
+from MIT in 2010 with a Computer Science degree and now earns $85,000
+annually as a Senior Software Engineer at Acme Corp.
+
+He can be reached at john.smith@example.com or (555) 123-4567. His
+office is located at 12 Main Street, Suite 400, Boston, MA 02110.
+
+Jane Doe, 42, joined Acme Corp in 2015 as Director of Engineering after
+eight years at Initech. She holds an MBA from Stanford and manages a
+team of 25 engineers with an annual budget of $3.2 million.
+"""
+
+
+def main():
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        print("Set GEMINI_API_KEY to run this test")
+        sys.exit(1)
+
+    print("Running serial extraction (parse_key_value_pairs)...")
+    start = time.perf_counter()
+    keys, values, comments = parse_key_value_pairs(TEST_TEXT, api_key)
+    serial_elapsed = time.perf_counter() - start
+    print(f"  {len(keys)} records in {serial_elapsed:.2f}s")
+
+    print("Running concurrent extraction (parse_key_value_pairs_concurrent)...")
+    start = time.perf_counter()
+    keys, values, comments = parse_key_value_pairs_concurrent(TEST_TEXT, api_key)
+    concurrent_elapsed = time.perf_counter() - start
+    print(f"  {len(keys)} records in {concurrent_elapsed:.2f}s")
+
+    print("\nExtracted records:")
+    for key, value, comment in zip(keys, values, comments):
+        print(f"  {key}: {value}")
+        print(f"    -> {comment}")
+
+
+if __name__ == "__main__":
+    main()
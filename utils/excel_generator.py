@@ -6,107 +6,249 @@ Exports ONLY 3 columns as per Final Plan: key, value, comments
 import pandas as pd
 from io import BytesIO
 import xlsxwriter
+import pyexcelerate
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+from openpyxl.utils import get_column_letter
 from openpyxl.utils.dataframe import dataframe_to_rows
 
+# Styles are immutable - build them once at import instead of per call
+HEADER_FONT = Font(name='Arial', size=11, bold=True, color='FFFFFF')
+HEADER_FILL = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='center', wrap_text=True)
+
+CELL_FONT = Font(name='Arial', size=10)
+CELL_ALIGNMENT = Alignment(horizontal='left', vertical='top', wrap_text=True)
+
+THIN_BORDER = Border(
+    left=Side(style='thin', color='000000'),
+    right=Side(style='thin', color='000000'),
+    top=Side(style='thin', color='000000'),
+    bottom=Side(style='thin', color='000000')
+)
+
+# Named styles are registered once per workbook and referenced by name,
+# so each cell assignment is a string lookup instead of four style-object
+# assignments that each re-hash into the workbook's style table
+HEADER_STYLE = NamedStyle(name='t2e_header', font=HEADER_FONT, fill=HEADER_FILL,
+                          alignment=HEADER_ALIGNMENT, border=THIN_BORDER)
+BODY_STYLE = NamedStyle(name='t2e_body', font=CELL_FONT,
+                        alignment=CELL_ALIGNMENT, border=THIN_BORDER)
+
+# Above this row count the per-cell styled path is too slow; stream the
+# sheet with openpyxl's write-only mode instead
+WRITE_ONLY_THRESHOLD = 5_000
+
+# Column-width sampling kicks in above this row count - widths are an
+# aesthetic concern, so a stride sample of the column is plenty
+_WIDTH_SAMPLE_THRESHOLD = 50_000
+_WIDTH_SAMPLE_SIZE = 2048
+
+
+def _column_max_length(series: pd.Series) -> int:
+    """
+    Longest rendered length of a column's values
+    String columns are measured in place with str.len() instead of
+    materializing a full astype(str) copy; very long columns are strided
+    down to ~2048 samples since width tuning is aesthetic, not exact
+
+    Args:
+        series: Column to measure
+
+    Returns:
+        int: Length of the longest value (0 for an empty column)
+    """
+    if len(series) > _WIDTH_SAMPLE_THRESHOLD:
+        series = series.iloc[::max(1, len(series) // _WIDTH_SAMPLE_SIZE)]
+
+    if pd.api.types.is_string_dtype(series):
+        max_length = series.str.len().max()
+    else:
+        max_length = series.astype(str).str.len().max()
+
+    return int(max_length) if pd.notna(max_length) else 0
+
 
 def generate_excel(
-    df: pd.DataFrame, 
-    include_header: bool = True, 
+    df: pd.DataFrame,
+    include_header: bool = True,
     auto_width: bool = True
 ) -> BytesIO:
     """
     Generate Excel file from DataFrame with formatting
     ONLY exports 3 columns: key, value, comments (as per Final Plan)
-    
+    Small frames get the fully styled path; large frames stream through
+    openpyxl's write-only mode which never builds the in-memory cell tree
+
     Args:
         df: DataFrame to export (must have key, value, comments columns)
         include_header: Whether to include column headers
         auto_width: Whether to auto-adjust column widths
-        
+
     Returns:
         BytesIO: Excel file buffer
     """
-    # Ensure only 3 required columns are exported
+    # Ensure only 3 required columns are exported - keep a column-selected
+    # view rather than materializing a full copy of the frame
     required_columns = ['key', 'value', 'comments']
-    export_df = df[[col for col in required_columns if col in df.columns]].copy()
-    
+    cols = [col for col in required_columns if col in df.columns]
+    export_df = df.loc[:, cols]
+
+    if len(export_df) >= WRITE_ONLY_THRESHOLD:
+        return _generate_excel_write_only(export_df, include_header, auto_width)
+
+    return _generate_excel_styled(export_df, include_header, auto_width)
+
+
+def _generate_excel_styled(
+    export_df: pd.DataFrame,
+    include_header: bool = True,
+    auto_width: bool = True
+) -> BytesIO:
+    """
+    Fully styled per-cell write path for small frames
+    """
     output = BytesIO()
-    
+
     # Create workbook
     wb = Workbook()
     ws = wb.active
     assert ws is not None, "Failed to get active worksheet"
     ws.title = "Extracted Data"
-    
-    # Define styles
-    header_font = Font(name='Arial', size=11, bold=True, color='FFFFFF')
-    header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-    header_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-    
-    cell_font = Font(name='Arial', size=10)
-    cell_alignment = Alignment(horizontal='left', vertical='top', wrap_text=True)
-    
-    thin_border = Border(
-        left=Side(style='thin', color='000000'),
-        right=Side(style='thin', color='000000'),
-        top=Side(style='thin', color='000000'),
-        bottom=Side(style='thin', color='000000')
-    )
-    
-    # Write data
+
+    # Register the shared named styles once per workbook
+    wb.add_named_style(HEADER_STYLE)
+    wb.add_named_style(BODY_STYLE)
+
+    # Write headers
     if include_header:
-        # Write headers
         for col_idx, column in enumerate(export_df.columns, 1):
             cell = ws.cell(row=1, column=col_idx, value=column)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-            cell.border = thin_border
-        
-        # Write data rows
-        for row_idx, row_data in enumerate(export_df.values, 2):
-            for col_idx, value in enumerate(row_data, 1):
-                cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                cell.font = cell_font
-                cell.alignment = cell_alignment
-                cell.border = thin_border
-    else:
-        # Write data without headers
-        for row_idx, row_data in enumerate(export_df.values, 1):
-            for col_idx, value in enumerate(row_data, 1):
-                cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                cell.font = cell_font
-                cell.alignment = cell_alignment
-                cell.border = thin_border
-    
-    # Auto-adjust column widths
+            cell.style = 't2e_header'
+
+    # Write data rows in a single loop; the header only shifts the start
+    # row. itertuples yields plain tuples with no per-row Series overhead
+    row_offset = 2 if include_header else 1
+    for row_idx, row_data in enumerate(export_df.itertuples(index=False, name=None), row_offset):
+        for col_idx, value in enumerate(row_data, 1):
+            cell = ws.cell(row=row_idx, column=col_idx, value=value)
+            cell.style = 't2e_body'
+
+    # Auto-adjust column widths - one vectorized pandas pass per column
+    # instead of re-walking every written cell
     if auto_width:
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter  # type: ignore
-            
-            for cell in column:
-                try:
-                    if cell.value:
-                        cell_length = len(str(cell.value))
-                        if cell_length > max_length:
-                            max_length = cell_length
-                except:
-                    pass
-            
+        for col_idx, column in enumerate(export_df.columns, 1):
+            max_length = _column_max_length(export_df[column])
+            if include_header:
+                max_length = max(max_length, len(str(column)))
             adjusted_width = min(max_length + 2, 50)  # Max width of 50
-            ws.column_dimensions[column_letter].width = adjusted_width
-    
+            ws.column_dimensions[get_column_letter(col_idx)].width = adjusted_width
+
     # Freeze header row
     if include_header:
         ws.freeze_panes = 'A2'
-    
+
     # Save to buffer
     wb.save(output)
     output.seek(0)
-    
+
+    return output
+
+
+def _generate_excel_write_only(
+    export_df: pd.DataFrame,
+    include_header: bool = True,
+    auto_width: bool = True
+) -> BytesIO:
+    """
+    Streaming write path for large frames using openpyxl write-only mode
+    Rows are serialized as they are appended, so peak memory stays flat
+    regardless of row count (install lxml for the fast XML backend)
+    """
+    output = BytesIO()
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Extracted Data")
+
+    # Column widths must be set before any rows are appended
+    if auto_width:
+        for col_idx, column in enumerate(export_df.columns, 1):
+            max_length = max(_column_max_length(export_df[column]), len(str(column)))
+            ws.column_dimensions[get_column_letter(col_idx)].width = min(max_length + 2, 50)
+
+    if include_header:
+        # The sheet view is serialized when the first row is flushed, so
+        # the freeze must be set before anything is appended
+        ws.freeze_panes = 'A2'
+        header_cells = []
+        for column in export_df.columns:
+            cell = WriteOnlyCell(ws, value=column)
+            cell.font = HEADER_FONT
+            cell.fill = HEADER_FILL
+            cell.alignment = HEADER_ALIGNMENT
+            cell.border = THIN_BORDER
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+    # Raw tuples append straight into the XML stream - no per-cell styling
+    for row_data in export_df.itertuples(index=False, name=None):
+        ws.append(row_data)
+
+    # Save to buffer
+    wb.save(output)
+    output.seek(0)
+
+    return output
+
+
+def generate_excel_fast(
+    df: pd.DataFrame,
+    include_header: bool = True,
+    auto_width: bool = True
+) -> BytesIO:
+    """
+    Bulk export path using PyExcelerate, which emits sheet XML directly
+    from a 2D list instead of going through a per-cell object model
+    Styling is limited to a bold header row, so route only large frames
+    here where export speed matters more than cosmetics
+
+    Args:
+        df: DataFrame to export (must have key, value, comments columns)
+        include_header: Whether to include column headers
+        auto_width: Whether to auto-adjust column widths
+
+    Returns:
+        BytesIO: Excel file buffer
+    """
+    # Ensure only 3 required columns are exported
+    required_columns = ['key', 'value', 'comments']
+    cols = [col for col in required_columns if col in df.columns]
+    export_df = df.loc[:, cols]
+
+    rows = export_df.astype(object).values.tolist()
+    if include_header:
+        rows = [list(export_df.columns)] + rows
+
+    wb = pyexcelerate.Workbook()
+    ws = wb.new_sheet("Extracted Data", data=rows)
+
+    # Single style applied to the whole header row, not per cell
+    if include_header:
+        ws.set_row_style(1, pyexcelerate.Style(
+            font=pyexcelerate.Font(bold=True, color=pyexcelerate.Color(255, 255, 255)),
+            fill=pyexcelerate.Fill(background=pyexcelerate.Color(54, 96, 146))
+        ))
+
+    if auto_width:
+        for col_idx, column in enumerate(export_df.columns, 1):
+            max_length = max(_column_max_length(export_df[column]), len(str(column)))
+            ws.set_col_style(col_idx, pyexcelerate.Style(size=min(max_length + 2, 50)))
+
+    output = BytesIO()
+    wb.save(output)
+    output.seek(0)
+
     return output
 
 
@@ -117,15 +259,26 @@ def generate_excel_with_xlsxwriter(
 ) -> BytesIO:
     """
     Alternative Excel generation using xlsxwriter for more features
+    Runs in constant_memory mode so finished rows stream to a temp file
+    instead of accumulating in memory - rows must therefore be written
+    strictly in order (header first), and merged ranges are unavailable,
+    which is fine for this flat 3-column layout
     """
     output = BytesIO()
-    
-    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-        df.to_excel(writer, sheet_name='Extracted Data', index=False, header=include_header)
-        
+
+    engine_kwargs = {
+        'options': {
+            'constant_memory': True,
+            # Skip the per-string regex scans for URLs/formulas - every
+            # cell here is plain data
+            'strings_to_urls': False,
+            'strings_to_formulas': False,
+        }
+    }
+
+    with pd.ExcelWriter(output, engine='xlsxwriter', engine_kwargs=engine_kwargs) as writer:
         workbook = writer.book
-        worksheet = writer.sheets['Extracted Data']
-        
+
         # Define formats
         header_format = workbook.add_format({  # type: ignore
             'bold': True,
@@ -136,33 +289,42 @@ def generate_excel_with_xlsxwriter(
             'valign': 'vcenter',
             'text_wrap': True
         })
-        
+
         cell_format = workbook.add_format({  # type: ignore
             'border': 1,
             'align': 'left',
             'valign': 'top',
             'text_wrap': True
         })
-        
-        # Apply header formatting
+
+        # Create the sheet up front so the header row can be written
+        # before any data rows (required by constant_memory mode)
+        worksheet = workbook.add_worksheet('Extracted Data')  # type: ignore
+        writer.sheets['Extracted Data'] = worksheet
+
         if include_header:
             for col_num, value in enumerate(df.columns.values):
                 worksheet.write(0, col_num, value, header_format)
-        
-        # Auto-adjust column widths
+
+        # Write body rows ourselves: pandas' to_excel emits cells
+        # column-major, and constant_memory mode flushes a row as soon
+        # as a higher row is touched, which would drop every column but
+        # the first from all rows except the last
+        row_offset = 1 if include_header else 0
+        for row_num, row_data in enumerate(df.itertuples(index=False, name=None), row_offset):
+            worksheet.write_row(row_num, 0, row_data)
+
+        # Auto-adjust column widths (column metadata, safe after writes)
         if auto_width:
             for idx, col in enumerate(df.columns):
-                max_length = max(
-                    df[col].astype(str).map(len).max(),
-                    len(col)
-                ) + 2
+                max_length = max(_column_max_length(df[col]), len(col)) + 2
                 max_length = min(max_length, 50)
                 worksheet.set_column(idx, idx, max_length, cell_format)
-        
+
         # Freeze header row
         if include_header:
             worksheet.freeze_panes(1, 0)
-    
+
     output.seek(0)
     return output
 
@@ -210,10 +372,7 @@ def generate_multi_sheet_excel(
             # Auto-adjust columns
             if auto_width:
                 for idx, col in enumerate(df.columns):
-                    max_length = max(
-                        df[col].astype(str).map(len).max(),
-                        len(col)
-                    ) + 2
+                    max_length = max(_column_max_length(df[col]), len(col)) + 2
                     worksheet.set_column(idx, idx, min(max_length, 50))
     
     output.seek(0)
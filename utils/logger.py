@@ -2,33 +2,46 @@
 Logging configuration for the application
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from datetime import datetime
 from pathlib import Path
 
 
 def setup_logger(name: str = "text2excel", level: int = logging.INFO) -> logging.Logger:
     """
     Set up application logger
-    
+    Records go through a queue to a background listener thread, so disk
+    writes never block the (possibly concurrent) extraction hot path
+
     Args:
         name: Logger name
         level: Logging level
-        
+
     Returns:
         logging.Logger: Configured logger instance
     """
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    
+
+    # Already configured - return before building handlers, otherwise
+    # every repeat call re-opens the log file just to throw the handler
+    # away, leaking a file descriptor each time
+    if logger.handlers:
+        return logger
+
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
     
-    # File handler with date-based log files
-    log_file = log_dir / f"app_{datetime.now().strftime('%Y%m%d')}.log"
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    # Rotate at midnight so long-running sessions roll over to a fresh
+    # file instead of writing to the date the process started on
+    log_file = log_dir / "app.log"
+    file_handler = logging.handlers.TimedRotatingFileHandler(
+        log_file, when="midnight", encoding='utf-8'
+    )
     file_handler.setLevel(level)
     
     # Console handler
@@ -43,12 +56,16 @@ def setup_logger(name: str = "text2excel", level: int = logging.INFO) -> logging
     
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
-    
-    # Add handlers if not already added
-    if not logger.handlers:
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
-    
+
+    # Queue records and let a background thread do the actual I/O
+    # (standard logging-cookbook pattern for concurrent apps)
+    log_queue: "queue.Queue" = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
     return logger
 
 
@@ -5,10 +5,125 @@ Follows the strategy from Final Plan Key Value Comments.txt
 
 import re
 import json
+import os
+import asyncio
+import hashlib
+import threading
 from typing import Dict, List, Optional, Any, Tuple
+import orjson
+import diskcache
 from google import genai
 from google.genai import types
 from .logger import logger
+from .semcache import semantic_cache
+
+# Maximum number of in-flight Gemini requests for the async extraction path
+GEMINI_CONCURRENCY = int(os.getenv("GEMINI_CONCURRENCY", "8"))
+
+# Number of chunks sent per Gemini request on the sync path - amortizes the
+# static prompt preamble and one round-trip across the batch
+GEMINI_BATCH_SIZE = int(os.getenv("GEMINI_BATCH_SIZE", "4"))
+
+# Persistent exact-match cache of Gemini responses - identical chunks skip
+# the API round-trip entirely across runs
+_CACHE = diskcache.Cache(os.path.expanduser("~/.cache/text2excel"))
+_CACHE_TTL = 7 * 86400  # seconds
+
+# Bump when the prompt templates change so stale cached extractions expire
+_PROMPT_VERSION = "2"
+
+# Paragraph separator - compiled once so chunking goes straight to the
+# compiled pattern instead of re-hashing the regex cache per call
+_PARA_RE = re.compile(r'\n{2,}')
+
+# Markdown code fence around a JSON payload, e.g. ```json ... ```
+_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*(.+?)\s*```\s*$', re.DOTALL)
+
+# Static instructions are sent as system_instruction so the provider can
+# reuse the cached prompt prefix across requests; the per-chunk user
+# prompt carries only metadata and the text itself
+_SYSTEM_PROMPT = """You are an extraction assistant. Given an input text chunk, return a JSON array of objects. Each object must have the fields:
+- key (string): canonical name for the data point
+- value (string): extracted value (preserve original words if possible)
+- raw_value (string): exact substring from the input that supports this pair
+- comments (string): DETAILED contextual commentary including: temporal context (as of what date/year), format notes (ISO dates, currency format), units of measurement, how this data point relates to other information, ambiguity notes, transformations applied, and analytical significance. Write 1-3 sentences of meaningful context. Never leave it empty.
+- provenance (string): the exact sentence or phrase from the input text where this fact was found
+- confidence (number): 0.0-1.0
+
+Rules:
+1. Create separate objects for each distinct factual item (date, amount, name, address, phone, product, status, etc.). Do not omit any factual statements.
+2. If a single sentence implies multiple keys (e.g., "John Doe, 42, lives at 12 Main St, pays $1200/month"), create separate objects for name, age, address, rent.
+3. If a value is ambiguous, include both candidate values in 'value' separated by " | " and explain in comments.
+4. Normalize dates to ISO (YYYY-MM-DD) in comments or raw_value only if you can be certain; otherwise keep original in value and note attempts in comments.
+5. Do not hallucinate missing facts.
+
+Return only valid JSON. If no key/value pairs are present, return an empty array: []"""
+
+_BATCH_SYSTEM_PROMPT = """You are an extraction assistant. Given several input text chunks, return a single JSON object mapping "chunk_0", "chunk_1", ... to JSON arrays of objects. Each object must have the fields:
+- key (string): canonical name for the data point
+- value (string): extracted value (preserve original words if possible)
+- raw_value (string): exact substring from the input that supports this pair
+- comments (string): DETAILED contextual commentary including: temporal context (as of what date/year), format notes (ISO dates, currency format), units of measurement, how this data point relates to other information, ambiguity notes, transformations applied, and analytical significance. Write 1-3 sentences of meaningful context. Never leave it empty.
+- provenance (string): the exact sentence or phrase from the input text where this fact was found
+- confidence (number): 0.0-1.0
+
+Rules:
+1. Create separate objects for each distinct factual item (date, amount, name, address, phone, product, status, etc.). Do not omit any factual statements.
+2. If a single sentence implies multiple keys (e.g., "John Doe, 42, lives at 12 Main St, pays $1200/month"), create separate objects for name, age, address, rent.
+3. If a value is ambiguous, include both candidate values in 'value' separated by " | " and explain in comments.
+4. Normalize dates to ISO (YYYY-MM-DD) in comments or raw_value only if you can be certain; otherwise keep original in value and note attempts in comments.
+5. Do not hallucinate missing facts.
+6. Keep extractions under the chunk they came from - return {"chunk_0": [...], "chunk_1": [...], ...} with one entry per chunk.
+
+Return only valid JSON. If a chunk has no key/value pairs, map its index to an empty array: []"""
+
+
+# Clients are cached per API key - construction sets up HTTP transports
+# and auth state, and reuse keeps the connection pool's sockets alive
+# across chunks and files
+_CLIENTS: Dict[str, genai.Client] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_client(api_key: Optional[str]) -> genai.Client:
+    """
+    Return a cached Gemini client for the given API key
+
+    Args:
+        api_key: Google Gemini API key
+
+    Returns:
+        genai.Client: Shared client instance for this key
+    """
+    client = _CLIENTS.get(api_key)
+    if client is None:
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(api_key)
+            if client is None:
+                client = genai.Client(
+                    api_key=api_key,
+                    http_options=types.HttpOptions(timeout=60_000)
+                )
+                _CLIENTS[api_key] = client
+    return client
+
+
+def _cache_key(chunk_text: str, custom_keys: Optional[List[str]] = None) -> str:
+    """
+    Compute the exact-match cache key for a chunk
+    Keyed on model, prompt version, custom keys and chunk text so any
+    change to the request invalidates the cached response
+
+    Args:
+        chunk_text: Text chunk being extracted
+        custom_keys: Optional list of keys to prioritize
+
+    Returns:
+        str: Hex digest usable as a cache key
+    """
+    keys_part = ','.join(custom_keys) if custom_keys else ''
+    raw = f"gemini-2.0-flash-lite|{_PROMPT_VERSION}|{keys_part}|{chunk_text}"
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
 
 
 def parse_key_value_pairs(
@@ -17,10 +132,10 @@ def parse_key_value_pairs(
     custom_keys: Optional[List[str]] = None,
     extraction_method: str = "Gemini LLM",
     doc_id: str = "D1"
-) -> List[Dict[str, Any]]:
+) -> Tuple[List[str], List[str], List[str]]:
     """
     Parse text and extract key-value pairs using Google Gemini LLM
-    Returns list of dicts with keys: key, value, comments
+    Returns parallel column lists: keys, values, comments
     
     Args:
         text: Input text to parse
@@ -30,29 +145,103 @@ def parse_key_value_pairs(
         doc_id: Document identifier (e.g., D1, D2)
         
     Returns:
-        list: List of extracted records with key, value, comments fields
+        tuple: (keys, values, comments) parallel column lists
     """
     if not api_key:
         raise ValueError("Google Gemini API key is required")
     
     # Preprocess text into chunks with paragraph tracking
     chunks = preprocess_and_chunk(text, doc_id)
-    
-    # Extract from each chunk using Gemini
+
+    # Extract chunks in batches - each batch costs one Gemini round-trip
     all_extractions = []
-    for chunk_data in chunks:
-        chunk_text = chunk_data['text']
-        doc_id_chunk = chunk_data['doc_id']
-        paragraph_index = chunk_data['paragraph_index']
-        char_offset = chunk_data['offset']
-        
-        extracted = extract_with_gemini(chunk_text, doc_id_chunk, paragraph_index, char_offset, custom_keys, api_key)
+    for start in range(0, len(chunks), GEMINI_BATCH_SIZE):
+        batch = chunks[start:start + GEMINI_BATCH_SIZE]
+        all_extractions.extend(extract_with_gemini_batch(batch, custom_keys, api_key))
+
+    # Convert to final 3-column format (key, value, comments)
+    return convert_to_three_columns(all_extractions)
+
+
+async def aparse_key_value_pairs(
+    text: str,
+    api_key: str,
+    custom_keys: Optional[List[str]] = None,
+    extraction_method: str = "Gemini LLM",
+    doc_id: str = "D1"
+) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Async variant of parse_key_value_pairs for concurrent processing
+    Gemini calls are I/O bound, so multiple documents can be extracted
+    concurrently via asyncio.gather without blocking each other
+
+    Args:
+        text: Input text to parse
+        api_key: Google Gemini API key
+        custom_keys: Optional list of specific keys to prioritize
+        extraction_method: Method to use for extraction (default: Gemini LLM)
+        doc_id: Document identifier (e.g., D1, D2)
+
+    Returns:
+        tuple: (keys, values, comments) parallel column lists
+    """
+    if not api_key:
+        raise ValueError("Google Gemini API key is required")
+
+    # Preprocess text into chunks with paragraph tracking
+    chunks = preprocess_and_chunk(text, doc_id)
+
+    # Cap in-flight Gemini requests so concurrent documents don't exceed
+    # the provider's rate limits
+    semaphore = asyncio.Semaphore(GEMINI_CONCURRENCY)
+
+    # Resolve the shared client up front so all chunk coroutines use the
+    # same underlying connection pool
+    client = _get_client(api_key)
+
+    # Fan out chunk extractions concurrently - each call is an I/O bound
+    # HTTP round-trip, so K chunks take ~1 RTT instead of K
+    results = await asyncio.gather(*[
+        aextract_with_gemini(
+            chunk_data['text'],
+            chunk_data['doc_id'],
+            chunk_data['paragraph_index'],
+            chunk_data['offset'],
+            custom_keys,
+            api_key,
+            semaphore,
+            client
+        )
+        for chunk_data in chunks
+    ])
+
+    all_extractions = []
+    for extracted in results:
         all_extractions.extend(extracted)
-    
+
     # Convert to final 3-column format (key, value, comments)
-    final_rows = convert_to_three_columns(all_extractions)
-    
-    return final_rows
+    return convert_to_three_columns(all_extractions)
+
+
+def parse_key_value_pairs_concurrent(
+    text: str,
+    api_key: str,
+    **kwargs: Any
+) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Sync entry point for the concurrent extraction path
+    Delegates to aparse_key_value_pairs via asyncio.run so callers
+    without an event loop still get the chunk fan-out speedup
+
+    Args:
+        text: Input text to parse
+        api_key: Google Gemini API key
+        **kwargs: Forwarded to aparse_key_value_pairs
+
+    Returns:
+        tuple: (keys, values, comments) parallel column lists
+    """
+    return asyncio.run(aparse_key_value_pairs(text, api_key, **kwargs))
 
 
 def preprocess_and_chunk(text: str, doc_id: str = "D1", chunk_size: int = 2000, overlap: int = 200) -> List[Dict[str, Any]]:
@@ -71,200 +260,442 @@ def preprocess_and_chunk(text: str, doc_id: str = "D1", chunk_size: int = 2000,
     """
     # Normalize text
     text = text.strip()
-    
-    # Split into paragraphs and track indices
-    paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
-    
+
+    # Locate paragraphs as (start, end) spans in the source buffer so
+    # chunks can be sliced out directly instead of re-joined per emission
+    paragraphs = []
+    pos = 0
+    for match in _PARA_RE.finditer(text):
+        if match.start() > pos:
+            paragraphs.append((pos, match.start()))
+        pos = match.end()
+    if pos < len(text):
+        paragraphs.append((pos, len(text)))
+
     chunks = []
-    current_chunk = []
+    chunk_para_indices = []
     current_length = 0
-    char_offset = 0
-    paragraph_start_index = 0
-    
-    for para_idx, para in enumerate(paragraphs):
-        para_len = len(para)
-        
-        if current_length + para_len > chunk_size and current_chunk:
-            # Create chunk
-            chunk_text = '\n\n'.join(current_chunk)
-            chunks.append({
-                'text': chunk_text,
-                'doc_id': doc_id,
-                'paragraph_index': paragraph_start_index,
-                'offset': char_offset
-            })
-            
+
+    def _emit_chunk():
+        first = chunk_para_indices[0]
+        last = chunk_para_indices[-1]
+        chunks.append({
+            'text': text[paragraphs[first][0]:paragraphs[last][1]],
+            'doc_id': doc_id,
+            'paragraph_index': first,
+            'offset': paragraphs[first][0]
+        })
+
+    for para_idx, (start, end) in enumerate(paragraphs):
+        para_len = end - start
+
+        if current_length + para_len > chunk_size and chunk_para_indices:
+            _emit_chunk()
+
             # Keep last paragraph for overlap
-            if len(current_chunk) > 1:
-                current_chunk = [current_chunk[-1]]
-                current_length = len(current_chunk[0])
-                paragraph_start_index = para_idx - 1
+            if len(chunk_para_indices) > 1:
+                last = chunk_para_indices[-1]
+                chunk_para_indices = [last]
+                current_length = paragraphs[last][1] - paragraphs[last][0]
             else:
-                current_chunk = []
+                chunk_para_indices = []
                 current_length = 0
-                paragraph_start_index = para_idx
-        
-        current_chunk.append(para)
+
+        chunk_para_indices.append(para_idx)
         current_length += para_len
-        char_offset += para_len + 2  # +2 for \n\n
-    
+
     # Add remaining chunk
-    if current_chunk:
-        chunk_text = '\n\n'.join(current_chunk)
-        chunks.append({
-            'text': chunk_text,
-            'doc_id': doc_id,
-            'paragraph_index': paragraph_start_index,
-            'offset': char_offset
-        })
-    
+    if chunk_para_indices:
+        _emit_chunk()
+
     return chunks if chunks else [{'text': text, 'doc_id': doc_id, 'paragraph_index': 0, 'offset': 0}]
 
 
-def extract_with_gemini(chunk_text: str, doc_id: str, paragraph_index: int, char_offset: int, custom_keys: Optional[List[str]] = None, api_key: Optional[str] = None) -> List[Dict[str, Any]]:
+def _build_prompts(chunk_text: str, doc_id: str, paragraph_index: int, custom_keys: Optional[List[str]] = None) -> Tuple[str, str]:
     """
-    Extract key-value pairs from a text chunk using Google Gemini LLM
-    
+    Build the system and user prompts for a single chunk (per Final Plan template)
+
     Args:
         chunk_text: Text chunk to process
         doc_id: Document identifier (e.g., D1, D2)
         paragraph_index: Starting paragraph index for this chunk
-        char_offset: Character offset from document start
         custom_keys: Optional list of keys to prioritize
-        api_key: Google Gemini API key
-        
+
     Returns:
-        list: Extracted records with key, value, raw_value, comments, provenance, confidence
+        tuple: (system_prompt, user_prompt)
     """
-    # Build system prompt (per Final Plan template)
-    system_prompt = """You are an extraction assistant. Given an input text chunk, return a JSON array of objects. Each object must have the fields:
-- key (string): canonical name for the data point
-- value (string): extracted value (preserve original words if possible)
-- raw_value (string): exact substring from the input that supports this pair
-- comments (string): DETAILED contextual commentary including: temporal context (as of what date/year), format notes (ISO dates, currency format), units of measurement, how this data point relates to other information, ambiguity notes, transformations applied, and analytical significance. Write 1-3 sentences of meaningful context.
-- provenance (string): the exact sentence or phrase from the input text where this fact was found
-- confidence (number): 0.0-1.0
-
-IMPORTANT: The 'comments' field must be descriptive and informative, providing rich context about the data point. Never leave it empty.
-
-Return only valid JSON. If no key/value pairs are present, return an empty array: []"""
-    
-    # Build user prompt (per Final Plan template)
+    # Per-chunk user prompt (static rules live in _SYSTEM_PROMPT)
     keys_hint = ""
     if custom_keys:
         keys_hint = f"\nPrioritize extracting these keys if present: {', '.join(custom_keys)}"
-    
+
     user_prompt = f"""doc_id: {doc_id}
 paragraph_index: {paragraph_index}
 text: \"\"\"
 {chunk_text}
-\"\"\"
+\"\"\"{keys_hint}"""
 
-Rules:
-1. Create separate objects for each distinct factual item (date, amount, name, address, phone, product, status, etc.). Do not omit any factual statements.
-2. If a single sentence implies multiple keys (e.g., "John Doe, 42, lives at 12 Main St, pays $1200/month"), create separate objects for name, age, address, rent.
-3. If a value is ambiguous, include both candidate values in 'value' separated by " | " and explain in comments.
-4. Normalize dates to ISO (YYYY-MM-DD) in comments or raw_value only if you can be certain; otherwise keep original in value and note attempts in comments.
-5. Do not hallucinate missing facts.{keys_hint}
+    return _SYSTEM_PROMPT, user_prompt
 
-CRITICAL: For EVERY extraction, provide detailed 'comments' explaining:
-- Temporal context (e.g., "As of year 2024", "Current as of document date")
-- Format details (e.g., "Formatted in ISO standard for easy parsing", "Currency in USD")
-- Relationships (e.g., "Implies 15 years of experience since graduation", "Indicates senior-level position")
-- Analytical significance (e.g., "Key demographic marker for analysis", "Critical for compliance tracking")
 
-Example of good comments:
-{{"key": "age", "value": "35", "raw_value": "35", "comments": "As of year 2024. This age serves as a key demographic marker for analytical purposes and indicates mid-career professional status.", "provenance": "...", "confidence": 0.95}}
-{{"key": "salary", "value": "$85,000", "raw_value": "$85,000", "comments": "Annual compensation in USD. Formatted with currency symbol and comma separator. Indicates competitive mid-level compensation for the industry.", "provenance": "...", "confidence": 0.9}}
+def _parse_gemini_response(response: Any, chunk_text: str, doc_id: str, paragraph_index: int) -> List[Dict[str, Any]]:
+    """
+    Parse the Gemini response into a list of extraction records
+
+    Args:
+        response: Response object returned by the Gemini API
+        chunk_text: Text chunk the response was generated for
+        doc_id: Document identifier (e.g., D1, D2)
+        paragraph_index: Starting paragraph index for this chunk
+
+    Returns:
+        list: Extracted records with key, value, raw_value, comments, provenance, confidence
+    """
+    response_text = _response_to_text(response)
 
-Return only the JSON array."""
-    
     try:
-        # Initialize Gemini client
-        client = genai.Client(api_key=api_key)
-        
-        # Call Gemini API using google-genai library
-        response = client.models.generate_content(
-            model='gemini-2.0-flash-lite',
-            contents=user_prompt,
-            config=types.GenerateContentConfig(
-                temperature=0.1,
-                max_output_tokens=4096,
-            ),
-        )
-        
-        # Parse JSON response
-        response_text = response.text if hasattr(response, 'text') else str(response)
-        if response_text is None:
-            response_text = ''
-        response_text = response_text.strip()
-        
-        # Remove markdown code blocks if present
-        if response_text.startswith('```'):
-            parts = response_text.split('```')
-            if len(parts) >= 2:
-                response_text = parts[1]
-                if response_text.startswith('json'):
-                    response_text = response_text[4:]
-            response_text = response_text.strip()
-        
-        extractions = json.loads(response_text)
-        
+        # orjson parses in C - meaningfully faster than the stdlib parser
+        # on the many small JSON payloads Gemini returns per chunk
+        extractions = orjson.loads(response_text)
+
         # Validate we got extractions
         if not extractions or not isinstance(extractions, list):
             # Log warning but don't fail - maybe text truly has no extractable data
             logger.warning(f"Gemini returned empty/invalid extraction for {doc_id}:para_{paragraph_index}. Text preview: {chunk_text[:200]}...")
             return []
-        
+
         # Provenance is already in correct format from LLM
         # LLM returns: <doc_id>:<paragraph_index>:<char_start>-<char_end>
-        for item in extractions:
-            # If LLM didn't provide proper provenance, add default
-            if not item.get('provenance') or ':' not in item.get('provenance', ''):
-                item['provenance'] = f"{doc_id}:{paragraph_index}:0-{len(chunk_text)}"
-        
+        _apply_default_provenance(extractions, chunk_text, doc_id, paragraph_index)
+
         return extractions
-        
-    except json.JSONDecodeError as e:
+
+    except (json.JSONDecodeError, orjson.JSONDecodeError) as e:
         # Raise exception with helpful context
-        error_text = response_text[:500] if 'response_text' in locals() and response_text else 'No response received'
+        error_text = response_text[:500] if response_text else 'No response received'
         raise ValueError(f"Failed to parse JSON response from Gemini API. Response: {error_text}\nError: {str(e)}")
+
+
+def _response_to_text(response: Any) -> str:
+    """
+    Pull the raw text out of a Gemini response and strip markdown fences
+    """
+    response_text = response.text if hasattr(response, 'text') else str(response)
+    if response_text is None:
+        response_text = ''
+    response_text = response_text.strip()
+
+    # Remove markdown code blocks if present - one compiled-regex match
+    # instead of split/startswith string shuffling
+    match = _FENCE_RE.match(response_text)
+    if match:
+        response_text = match.group(1)
+
+    return response_text
+
+
+def _apply_default_provenance(extractions: List[Dict[str, Any]], chunk_text: str, doc_id: str, paragraph_index: int) -> None:
+    """
+    Fill in default provenance for records where the LLM omitted it
+    Expected format: <doc_id>:<paragraph_index>:<char_start>-<char_end>
+    """
+    for item in extractions:
+        # If LLM didn't provide proper provenance, add default
+        if not item.get('provenance') or ':' not in item.get('provenance', ''):
+            item['provenance'] = f"{doc_id}:{paragraph_index}:0-{len(chunk_text)}"
+
+
+def _raise_gemini_error(e: Exception) -> None:
+    """
+    Translate a Gemini API failure into a user-facing exception
+    Checks for API key errors and provides a clear message
+    """
+    error_msg = str(e)
+    if 'API key not valid' in error_msg or 'API_KEY_INVALID' in error_msg:
+        raise ValueError("Invalid Gemini API key. Please check your API key and try again.\n\nTo get a valid API key:\n1. Go to https://aistudio.google.com/app/apikey\n2. Create or copy your API key\n3. Paste it in the sidebar")
+    elif 'INVALID_ARGUMENT' in error_msg:
+        raise ValueError(f"Invalid API request: {error_msg}")
+    else:
+        raise Exception(f"Gemini API call failed: {error_msg}")
+
+
+def extract_with_gemini(chunk_text: str, doc_id: str, paragraph_index: int, char_offset: int, custom_keys: Optional[List[str]] = None, api_key: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Extract key-value pairs from a text chunk using Google Gemini LLM
+
+    Args:
+        chunk_text: Text chunk to process
+        doc_id: Document identifier (e.g., D1, D2)
+        paragraph_index: Starting paragraph index for this chunk
+        char_offset: Character offset from document start
+        custom_keys: Optional list of keys to prioritize
+        api_key: Google Gemini API key
+
+    Returns:
+        list: Extracted records with key, value, raw_value, comments, provenance, confidence
+    """
+    # Check the exact-match cache before paying a Gemini round-trip
+    cache_key = _cache_key(chunk_text, custom_keys)
+    cached = _CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Semantic tier - reuse extractions from a near-duplicate chunk
+    cached = semantic_cache.get(chunk_text)
+    if cached is not None:
+        return cached
+
+    system_prompt, user_prompt = _build_prompts(chunk_text, doc_id, paragraph_index, custom_keys)
+
+    try:
+        # Reuse the shared Gemini client for this API key
+        client = _get_client(api_key)
+
+        # Call Gemini API using google-genai library
+        response = client.models.generate_content(
+            model='gemini-2.0-flash-lite',
+            contents=user_prompt,
+            config=types.GenerateContentConfig(
+                system_instruction=system_prompt,
+                temperature=0.1,
+                max_output_tokens=4096,
+            ),
+        )
     except Exception as e:
-        # Check for API key errors and provide clear message
-        error_msg = str(e)
-        if 'API key not valid' in error_msg or 'API_KEY_INVALID' in error_msg:
-            raise ValueError("Invalid Gemini API key. Please check your API key and try again.\n\nTo get a valid API key:\n1. Go to https://aistudio.google.com/app/apikey\n2. Create or copy your API key\n3. Paste it in the sidebar")
-        elif 'INVALID_ARGUMENT' in error_msg:
-            raise ValueError(f"Invalid API request: {error_msg}")
+        _raise_gemini_error(e)
+
+    extractions = _parse_gemini_response(response, chunk_text, doc_id, paragraph_index)
+    _CACHE.set(cache_key, extractions, expire=_CACHE_TTL)
+    semantic_cache.add(chunk_text, extractions)
+    return extractions
+
+
+async def aextract_with_gemini(chunk_text: str, doc_id: str, paragraph_index: int, char_offset: int, custom_keys: Optional[List[str]] = None, api_key: Optional[str] = None, semaphore: Optional[asyncio.Semaphore] = None, client: Optional[genai.Client] = None) -> List[Dict[str, Any]]:
+    """
+    Async variant of extract_with_gemini using the google-genai async API
+
+    Args:
+        chunk_text: Text chunk to process
+        doc_id: Document identifier (e.g., D1, D2)
+        paragraph_index: Starting paragraph index for this chunk
+        char_offset: Character offset from document start
+        custom_keys: Optional list of keys to prioritize
+        api_key: Google Gemini API key
+        semaphore: Optional semaphore capping in-flight Gemini requests
+        client: Optional shared Gemini client (constructed from api_key if omitted)
+
+    Returns:
+        list: Extracted records with key, value, raw_value, comments, provenance, confidence
+    """
+    # Check the exact-match cache before paying a Gemini round-trip.
+    # Both cache tiers block (disk I/O here, an embedding encode plus a
+    # FAISS search in the semantic tier), so run them in a worker thread
+    # to keep the event loop free for the other in-flight chunks
+    cache_key = _cache_key(chunk_text, custom_keys)
+    cached = await asyncio.to_thread(_CACHE.get, cache_key)
+    if cached is not None:
+        return cached
+
+    # Semantic tier - reuse extractions from a near-duplicate chunk
+    cached = await asyncio.to_thread(semantic_cache.get, chunk_text)
+    if cached is not None:
+        return cached
+
+    system_prompt, user_prompt = _build_prompts(chunk_text, doc_id, paragraph_index, custom_keys)
+
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(GEMINI_CONCURRENCY)
+
+    try:
+        # Reuse the shared Gemini client unless one was provided
+        if client is None:
+            client = _get_client(api_key)
+
+        # Call Gemini API using google-genai's async interface
+        async with semaphore:
+            response = await client.aio.models.generate_content(
+                model='gemini-2.0-flash-lite',
+                contents=user_prompt,
+                config=types.GenerateContentConfig(
+                    system_instruction=system_prompt,
+                    temperature=0.1,
+                    max_output_tokens=4096,
+                ),
+            )
+    except Exception as e:
+        _raise_gemini_error(e)
+
+    extractions = _parse_gemini_response(response, chunk_text, doc_id, paragraph_index)
+    # Cache writes block the same way the reads do
+    await asyncio.to_thread(_CACHE.set, cache_key, extractions, expire=_CACHE_TTL)
+    await asyncio.to_thread(semantic_cache.add, chunk_text, extractions)
+    return extractions
+
+
+def _build_batch_prompts(batch: List[Dict[str, Any]], custom_keys: Optional[List[str]] = None) -> Tuple[str, str]:
+    """
+    Build prompts covering several chunks in one request
+    The model is asked to return a JSON object keyed by chunk index so
+    results can be mapped back to each chunk's metadata
+
+    Args:
+        batch: List of chunk dicts (text, doc_id, paragraph_index, offset)
+        custom_keys: Optional list of keys to prioritize
+
+    Returns:
+        tuple: (system_prompt, user_prompt)
+    """
+    # Per-batch user prompt (static rules live in _BATCH_SYSTEM_PROMPT)
+    keys_hint = ""
+    if custom_keys:
+        keys_hint = f"\nPrioritize extracting these keys if present: {', '.join(custom_keys)}"
+
+    chunk_sections = []
+    for i, chunk_data in enumerate(batch):
+        chunk_sections.append(f"""### CHUNK {i} ###
+doc_id: {chunk_data['doc_id']}
+paragraph_index: {chunk_data['paragraph_index']}
+text: \"\"\"
+{chunk_data['text']}
+\"\"\"""")
+
+    user_prompt = chr(10).join(chunk_sections) + keys_hint
+
+    return _BATCH_SYSTEM_PROMPT, user_prompt
+
+
+def _parse_batch_response(response: Any, batch: List[Dict[str, Any]], custom_keys: Optional[List[str]] = None) -> List[List[Dict[str, Any]]]:
+    """
+    Parse a batched Gemini response back into per-chunk extraction lists
+
+    Args:
+        response: Response object returned by the Gemini API
+        batch: The chunk dicts the request covered, in order
+        custom_keys: Optional list of keys used for the request (for cache keys)
+
+    Returns:
+        list: One extraction list per chunk, aligned with batch order
+    """
+    response_text = _response_to_text(response)
+
+    try:
+        per_chunk = orjson.loads(response_text)
+    except (json.JSONDecodeError, orjson.JSONDecodeError) as e:
+        error_text = response_text[:500] if response_text else 'No response received'
+        raise ValueError(f"Failed to parse JSON response from Gemini API. Response: {error_text}\nError: {str(e)}")
+
+    if not isinstance(per_chunk, dict):
+        logger.warning(f"Gemini batch response was not an object. Text preview: {response_text[:200]}...")
+        return [[] for _ in batch]
+
+    results = []
+    for i, chunk_data in enumerate(batch):
+        extractions = per_chunk.get(f"chunk_{i}")
+        if not isinstance(extractions, list):
+            # Chunk missing from the response (or not an array) - leave
+            # it uncached so a later run can retry it
+            logger.warning(f"Gemini returned missing/invalid extraction for {chunk_data['doc_id']}:para_{chunk_data['paragraph_index']}. Text preview: {chunk_data['text'][:200]}...")
+            results.append([])
+            continue
+
+        _apply_default_provenance(extractions, chunk_data['text'], chunk_data['doc_id'], chunk_data['paragraph_index'])
+
+        # Populate the per-chunk caches so future runs skip the API call.
+        # An empty array is cached too: "nothing extractable" is a valid
+        # answer (the single-chunk path caches it as well), and skipping
+        # it re-paid the round-trip on every run
+        _CACHE.set(_cache_key(chunk_data['text'], custom_keys), extractions, expire=_CACHE_TTL)
+        semantic_cache.add(chunk_data['text'], extractions)
+
+        results.append(extractions)
+
+    return results
+
+
+def extract_with_gemini_batch(batch: List[Dict[str, Any]], custom_keys: Optional[List[str]] = None, api_key: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Extract key-value pairs from several chunks with one Gemini request
+    Amortizes the static prompt preamble and a full round-trip across the
+    batch instead of paying both per chunk
+
+    Args:
+        batch: List of chunk dicts (text, doc_id, paragraph_index, offset)
+        custom_keys: Optional list of keys to prioritize
+        api_key: Google Gemini API key
+
+    Returns:
+        list: Extracted records across all chunks in batch order
+    """
+    # Serve cached chunks up front and only send the misses to Gemini
+    cached_results = {}
+    misses = []
+    for i, chunk_data in enumerate(batch):
+        cached = _CACHE.get(_cache_key(chunk_data['text'], custom_keys))
+        if cached is None:
+            cached = semantic_cache.get(chunk_data['text'])
+        if cached is not None:
+            cached_results[i] = cached
         else:
-            raise Exception(f"Gemini API call failed: {error_msg}")
+            misses.append((i, chunk_data))
+
+    if misses:
+        miss_chunks = [chunk_data for _, chunk_data in misses]
+        if len(miss_chunks) == 1:
+            chunk_data = miss_chunks[0]
+            extracted = extract_with_gemini(chunk_data['text'], chunk_data['doc_id'], chunk_data['paragraph_index'], chunk_data['offset'], custom_keys, api_key)
+            cached_results[misses[0][0]] = extracted
+        else:
+            system_prompt, user_prompt = _build_batch_prompts(miss_chunks, custom_keys)
+
+            try:
+                # Reuse the shared Gemini client for this API key
+                client = _get_client(api_key)
+
+                # Call Gemini API using google-genai library
+                response = client.models.generate_content(
+                    model='gemini-2.0-flash-lite',
+                    contents=user_prompt,
+                    config=types.GenerateContentConfig(
+                        system_instruction=system_prompt,
+                        temperature=0.1,
+                        max_output_tokens=8192,
+                    ),
+                )
+            except Exception as e:
+                _raise_gemini_error(e)
+
+            per_chunk = _parse_batch_response(response, miss_chunks, custom_keys)
+            for (i, _), extracted in zip(misses, per_chunk):
+                cached_results[i] = extracted
+
+    all_extractions = []
+    for i in range(len(batch)):
+        all_extractions.extend(cached_results.get(i, []))
+
+    return all_extractions
 
 
-def convert_to_three_columns(extractions: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+def convert_to_three_columns(extractions: List[Dict[str, Any]]) -> Tuple[List[str], List[str], List[str]]:
     """
-    Convert Gemini extraction format to final 3-column format: key, value, comments
-    
+    Convert Gemini extraction format to three parallel column lists
+    Column-oriented output feeds pandas directly without materializing an
+    intermediate list of per-row dicts
+
     Args:
         extractions: List of extraction dicts from Gemini (with raw_value, provenance, confidence)
-        
+
     Returns:
-        list: List of dicts with only 3 keys: key, value, comments
+        tuple: (keys, values, comments) parallel lists
     """
-    final_rows = []
-    
+    keys = []
+    values = []
+    comments = []
+
     for item in extractions:
-        # Get core fields
-        key = item.get('key', 'unknown_key')
-        value = item.get('value', '')
-        
+        keys.append(item.get('key', 'unknown_key'))
+        values.append(item.get('value', ''))
         # Use only the LLM's comments field for the comments column
         # This contains context, units, ambiguity notes, and transformations
-        comments = item.get('comments', '')
-        
-        final_rows.append({
-            'key': key,
-            'value': value,
-            'comments': comments
-        })
-    
-    return final_rows
+        comments.append(item.get('comments', ''))
+
+    return keys, values, comments
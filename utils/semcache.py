@@ -0,0 +1,141 @@
+"""
+Semantic cache for near-duplicate chunk extractions
+Reuses Gemini results for chunks that are near-identical to previously
+extracted text (boilerplate headers, repeated clauses) based on
+embedding similarity, avoiding the LLM round-trip entirely
+"""
+
+import os
+import atexit
+import pickle
+import threading
+from typing import Any, List, Optional
+
+from .logger import logger
+
+# faiss and sentence-transformers are optional - the semantic tier is
+# skipped entirely when they are not installed
+try:
+    import faiss
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMCACHE_AVAILABLE = True
+except ImportError:
+    SEMCACHE_AVAILABLE = False
+
+# Minimum cosine similarity for a cache hit
+SEM_THRESHOLD = float(os.getenv("SEM_THRESHOLD", "0.97"))
+
+# Small local embedding model - fast enough to run per chunk on CPU
+_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+_CACHE_DIR = os.path.expanduser("~/.cache/text2excel")
+_INDEX_PATH = os.path.join(_CACHE_DIR, "semcache.faiss")
+_RESULTS_PATH = os.path.join(_CACHE_DIR, "semcache.pkl")
+
+
+class SemanticCache:
+    """
+    FAISS-backed semantic cache mapping chunk embeddings to extractions
+    Embeddings are L2-normalized so inner product equals cosine similarity
+    """
+
+    def __init__(self, threshold: float = SEM_THRESHOLD):
+        self.threshold = threshold
+        self._model: Optional[Any] = None
+        self._index: Optional[Any] = None
+        self._results: List[Any] = []
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    def _ensure_ready(self) -> None:
+        """Lazily load the embedding model and the persisted index"""
+        if self._model is not None:
+            return
+
+        self._model = SentenceTransformer(_EMBEDDING_MODEL)
+        dim = self._model.get_sentence_embedding_dimension()
+
+        # Reload a previously persisted index if both files are present
+        if os.path.exists(_INDEX_PATH) and os.path.exists(_RESULTS_PATH):
+            try:
+                self._index = faiss.read_index(_INDEX_PATH)
+                with open(_RESULTS_PATH, 'rb') as f:
+                    self._results = pickle.load(f)
+            except Exception as e:
+                logger.warning(f"Failed to load semantic cache, starting empty: {e}")
+                self._index = faiss.IndexFlatIP(dim)
+                self._results = []
+        else:
+            self._index = faiss.IndexFlatIP(dim)
+
+    def _embed(self, text: str) -> "np.ndarray":
+        """Embed text and L2-normalize so inner product = cosine similarity"""
+        vec = self._model.encode([text], convert_to_numpy=True).astype('float32')
+        faiss.normalize_L2(vec)
+        return vec
+
+    def get(self, text: str) -> Optional[Any]:
+        """
+        Return cached extractions for a near-duplicate chunk, or None
+
+        Args:
+            text: Chunk text to look up
+
+        Returns:
+            Cached extraction list on a hit, None on a miss
+        """
+        if not SEMCACHE_AVAILABLE:
+            return None
+
+        with self._lock:
+            self._ensure_ready()
+            if self._index.ntotal == 0:
+                return None
+
+            vec = self._embed(text)
+            scores, indices = self._index.search(vec, 1)
+            if scores[0][0] >= self.threshold:
+                return self._results[indices[0][0]]
+
+        return None
+
+    def add(self, text: str, extractions: Any) -> None:
+        """
+        Store extractions for a chunk so near-duplicates hit the cache
+
+        Args:
+            text: Chunk text that was extracted
+            extractions: Extraction list returned by Gemini
+        """
+        if not SEMCACHE_AVAILABLE:
+            return
+
+        with self._lock:
+            self._ensure_ready()
+            vec = self._embed(text)
+            self._index.add(vec)
+            self._results.append(extractions)
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the index and results to disk (called at shutdown)"""
+        if not SEMCACHE_AVAILABLE:
+            return
+
+        with self._lock:
+            if self._index is None or not self._dirty:
+                return
+            try:
+                os.makedirs(_CACHE_DIR, exist_ok=True)
+                faiss.write_index(self._index, _INDEX_PATH)
+                with open(_RESULTS_PATH, 'wb') as f:
+                    pickle.dump(self._results, f)
+                self._dirty = False
+            except Exception as e:
+                logger.warning(f"Failed to persist semantic cache: {e}")
+
+
+# Shared cache instance, persisted on interpreter shutdown
+semantic_cache = SemanticCache()
+atexit.register(semantic_cache.save)
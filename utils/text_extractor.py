@@ -2,13 +2,225 @@
 Text extraction module for different file formats
 """
 
+import hashlib
 import io
+import os
 import re
 import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union
 from docx import Document
+from docx.oxml.ns import qn
 from PyPDF2 import PdfReader
 
+# pypdfium2 wraps the PDFium C++ engine - noticeably faster and with
+# better text quality than pure-Python PyPDF2, which stays as fallback
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# numpy ships with pandas so it is effectively always present, but keep
+# the import guarded like the other accelerators for minimal installs
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional JIT backend for the normalization scan - numba is heavy, so
+# like pypdfium2 it only switches on when installed
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional linear-time regex engine (google-re2). Compiles patterns to
+# a DFA, so matching never backtracks pathologically on hostile input
+try:
+    import re2 as re_fast
+except ImportError:
+    re_fast = None
+
+
+def _compile(pattern: str):
+    """Compile a cleanup pattern with re2 when available, stdlib re
+    otherwise (also the fallback for syntax re2 does not support)"""
+    if re_fast is not None:
+        try:
+            return re_fast.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
+# Deletes ASCII control characters (except \t, \n, \r) and DEL in one
+# C-level str.translate pass - built once at import
+_ASCII_CTRL_TABLE = dict.fromkeys(
+    [i for i in range(0x20) if i not in (0x09, 0x0A, 0x0D)] + [0x7F],
+    None
+)
+
+# Same idea for the Unicode path: one C-level str.translate scan instead
+# of a Python-level isprintable() check per character. Besides the C0
+# controls (minus \t, \n, \r), DEL and the C1 block, this covers the
+# invisible format/separator characters isprintable() rejected: soft
+# hyphen, Arabic letter mark, zero-width and directional marks, line and
+# paragraph separators, word joiner and friends, the BOM (so a UTF-8-BOM
+# upload never leaks ﻿ into prompts or exports) and the interlinear
+# annotation controls
+_CTRL_TRANSLATE = dict(_ASCII_CTRL_TABLE)
+_CTRL_TRANSLATE.update(dict.fromkeys(range(0x80, 0xA0), None))
+_CTRL_TRANSLATE.update(dict.fromkeys(
+    [0x00AD, 0x061C]
+    + list(range(0x200B, 0x2010))   # zero-width chars, joiners, marks
+    + [0x2028, 0x2029]              # line / paragraph separators
+    + list(range(0x202A, 0x202F))   # directional embedding/override
+    + list(range(0x2060, 0x2070))   # word joiner, invisible operators
+    + [0xFEFF]                      # byte-order mark
+    + list(range(0xFFF9, 0xFFFC)),  # interlinear annotation controls
+    None
+))
+
+# Hot-path patterns compiled once at import - normalize_text runs per
+# upload (and per line for the whitespace collapse), so skipping the
+# re-cache lookup on every call is worthwhile
+_WS_RE = _compile(r'[ \t]+')
+
+# Anything that would make the cleanup pipeline change ASCII text:
+# control characters, tabs, \r, doubled spaces, whitespace hugging a
+# newline, or runs of three or more newlines. No match means the input
+# is already in normalized form
+_DIRTY_RE = _compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F\t\r]|  | \n|\n |\n{3,}')
+
+# Matches any run of line breaks (in \r\n, \r or \n form) together with
+# the horizontal whitespace hugging them, so one substitution pass can
+# normalize newlines, strip line edges and collapse blank-line runs
+_NL_EDGE_RE = _compile(r'[ \t]*[\r\n](?:[ \t]*[\r\n])*[ \t]*')
+
+
+def _clean_nl(match: "re.Match") -> str:
+    """Replacement for _NL_EDGE_RE: one line break stays a line break,
+    anything more collapses to a single paragraph break"""
+    run = match.group(0)
+    breaks = run.count('\n') + run.count('\r') - run.count('\r\n')
+    return '\n' if breaks == 1 else '\n\n'
+
+
+# Inputs below this size finish faster in the translate+regex pipeline
+# than they take to round-trip through UTF-32 for the JIT scanner
+_JIT_THRESHOLD = 65_536
+
+
+def _clean_codepoints_impl(arr, out):
+    """Single pass over UTF-32 code points implementing the whole ASCII
+    cleanup: drop control characters, collapse space/tab runs, strip
+    line edges, collapse blank-line runs and trim the ends
+    Written JIT-compilably (index loop, scalar state) so numba can
+    compile it to native code; returns the output length"""
+    n = 0
+    pending_breaks = 0
+    pending_space = False
+    for i in range(arr.shape[0]):
+        c = arr[i]
+        if c == 13:
+            # \r\n pairs count as one break; dropped control characters
+            # between the \r and \n must not split the pair, since the
+            # regex pipeline strips them before normalizing newlines
+            j = i + 1
+            while j < arr.shape[0]:
+                cj = arr[j]
+                if (cj < 32 and cj != 9 and cj != 10 and cj != 13) \
+                        or cj == 127 or (128 <= cj < 160):
+                    j += 1
+                else:
+                    break
+            if j < arr.shape[0] and arr[j] == 10:
+                continue
+            c = 10
+        if c == 10:
+            pending_breaks += 1
+            pending_space = False
+            continue
+        if c == 9 or c == 32:
+            pending_space = True
+            continue
+        if c < 32 or c == 127 or (128 <= c < 160):
+            continue
+        if pending_breaks > 0:
+            if n > 0:  # leading breaks are trimmed entirely
+                out[n] = 10
+                n += 1
+                if pending_breaks > 1:
+                    out[n] = 10
+                    n += 1
+            pending_breaks = 0
+            pending_space = False
+        if pending_space:
+            if n > 0 and out[n - 1] != 10:
+                out[n] = 32
+                n += 1
+            pending_space = False
+        out[n] = c
+        n += 1
+    return n
+
+
+_clean_codepoints = njit(cache=True)(_clean_codepoints_impl) if njit is not None else None
+
+# Below this size the encode/decode round-trip costs more than the
+# vectorized scan saves
+_NP_THRESHOLD = 64_000
+
+
+def _np_collapse_ws(data: bytes) -> bytes:
+    """Collapse space/tab runs to a single character with one vectorized
+    pass over the raw bytes (ASCII input only), so the regex passes
+    afterwards have almost nothing left to rewrite"""
+    buf = np.frombuffer(data, dtype=np.uint8)
+    ws = (buf == 0x20) | (buf == 0x09)
+    prev_ws = np.empty_like(ws)
+    prev_ws[0] = False
+    prev_ws[1:] = ws[:-1]
+    keep = ~(ws & prev_ws)
+    return buf[keep].tobytes()
+
+
+# Bytes twins of the cleanup machinery: ASCII input runs the whole
+# pipeline on a one-byte-per-character buffer - a quarter of the memory
+# traffic of a UCS-4 string - and decodes exactly once at the end
+_ASCII_CTRL_DELETE = bytes(sorted(_ASCII_CTRL_TABLE))
+_NL_EDGE_RE_B = _compile(rb'[ \t]*[\r\n](?:[ \t]*[\r\n])*[ \t]*')
+_WS_RE_B = _compile(rb'[ \t]+')
+
+
+def _clean_nl_b(match) -> bytes:
+    """Bytes counterpart of _clean_nl"""
+    run = match.group(0)
+    breaks = run.count(b'\n') + run.count(b'\r') - run.count(b'\r\n')
+    return b'\n' if breaks == 1 else b'\n\n'
+
+
+def _ascii_clean(text: str) -> str:
+    """Run the cleanup pipeline for ASCII input over its encoded bytes
+    NFKC is an identity on ASCII, so the steps are: optional vectorized
+    whitespace pre-collapse, control-char delete, fused newline pass and
+    in-line whitespace collapse - all in the bytes domain, decoded once"""
+    buf = text.encode('ascii')
+    if np is not None and len(buf) > _NP_THRESHOLD:
+        buf = _np_collapse_ws(buf)
+    buf = buf.translate(None, _ASCII_CTRL_DELETE)
+    buf = _NL_EDGE_RE_B.sub(_clean_nl_b, buf)
+    buf = _WS_RE_B.sub(b' ', buf)
+    return buf.strip().decode('ascii')
+
+
+def _jit_clean(text: str) -> str:
+    """Run the JIT scanner over a large ASCII string"""
+    arr = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    out = np.empty(arr.shape[0], dtype=np.uint32)
+    n = _clean_codepoints(arr, out)
+    return out[:n].tobytes().decode('utf-32-le')
+
 
 def extract_text_from_file(file) -> str:
     """
@@ -21,65 +233,119 @@ def extract_text_from_file(file) -> str:
     Returns:
         str: Extracted and normalized text content
     """
-    file_extension = file.name.split('.')[-1].lower()
-    
-    if file_extension == 'txt':
-        raw_text = extract_from_txt(file)
-    elif file_extension == 'docx':
-        raw_text = extract_from_docx(file)
-    elif file_extension == 'pdf':
-        raw_text = extract_from_pdf(file)
-    else:
+    # rpartition avoids building a list of every dot-separated part of
+    # the filename just to take the last one
+    file_extension = file.name.rpartition('.')[2].lower()
+
+    extractor = _EXTRACTORS.get(file_extension)
+    if extractor is None:
         raise ValueError(f"Unsupported file format: {file_extension}")
-    
+    raw_text = extractor(file)
+
     # Apply normalization per Final Plan requirements
     return normalize_text(raw_text)
 
 
 def extract_from_txt(file) -> str:
     """Extract text from .txt file"""
+    # Read the bytes once and decode the same object twice at worst -
+    # no seek/re-read, and errors='replace' avoids the mojibake a
+    # latin-1 fallback produces on mixed-encoding inputs
+    raw = file.read()
+    # Normalize line endings while the data is still one byte per char
+    # (ASCII bytes never occur inside UTF-8 multi-byte sequences, so
+    # this is safe pre-decode); with \r gone, clean files can take the
+    # no-op early exit in normalize_text
+    raw = raw.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
     try:
-        # Try UTF-8 first
-        content = file.read().decode('utf-8')
+        return raw.decode('utf-8')
     except UnicodeDecodeError:
-        # Fallback to latin-1
-        file.seek(0)
-        content = file.read().decode('latin-1')
-    
-    return content
+        return raw.decode('utf-8', errors='replace')
 
 
 def extract_from_docx(file) -> str:
     """Extract text from .docx file"""
+    # Go straight to the underlying lxml tree: one XPath selects every
+    # paragraph - table cells included, since <w:p> inside <w:tc> matches
+    # the same query - and joining the <w:t> nodes per paragraph skips
+    # the python-docx wrapper objects built per paragraph and run
     doc = Document(file)
-    
-    # Extract text from paragraphs
-    text_parts = []
-    for paragraph in doc.paragraphs:
-        if paragraph.text.strip():
-            text_parts.append(paragraph.text)
-    
-    # Extract text from tables
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                if cell.text.strip():
-                    text_parts.append(cell.text)
-    
-    return '\n'.join(text_parts)
+    paragraphs = doc.element.body.xpath('.//w:p')
+    texts = (''.join(t.text or '' for t in p.iter(qn('w:t'))) for p in paragraphs)
+    return '\n'.join(t for t in texts if t and not t.isspace())
 
 
 def extract_from_pdf(file) -> str:
     """Extract text from .pdf file"""
+    if pdfium is not None:
+        try:
+            return _extract_pdf_pdfium(file.read())
+        except Exception:
+            # Malformed or unsupported PDF - retry with PyPDF2
+            file.seek(0)
+    return _extract_pdf_pypdf2(file)
+
+
+def _extract_pdf_pdfium(data: bytes) -> str:
+    """Extract PDF text with the PDFium backend"""
+    pdf = pdfium.PdfDocument(data)
+    try:
+        text_parts = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            text = textpage.get_text_bounded()
+            textpage.close()
+            page.close()
+            if text.strip():
+                # PDFium emits \r\n line endings; normalizing per page
+                # keeps the allocations small and off normalize_text
+                text_parts.append(text.replace('\r\n', '\n').replace('\r', '\n'))
+        return '\n'.join(text_parts)
+    finally:
+        pdf.close()
+
+
+# Serial page extraction is fine for short PDFs; above this page count
+# the pool's spin-up cost is repaid many times over
+_PDF_PARALLEL_THRESHOLD = 10
+
+
+def _extract_pdf_pypdf2(file) -> str:
+    """Extract PDF text with the PyPDF2 fallback backend"""
     pdf_reader = PdfReader(file)
-    
-    text_parts = []
-    for page in pdf_reader.pages:
-        text = page.extract_text()
-        if text.strip():
-            text_parts.append(text)
-    
-    return '\n'.join(text_parts)
+    pages = pdf_reader.pages
+
+    if len(pages) > _PDF_PARALLEL_THRESHOLD:
+        # Per-page extraction is independent, so fan the pages out over
+        # a thread pool; ex.map preserves page order
+        workers = min(8, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            texts = list(ex.map(lambda p: p.extract_text() or '', pages))
+    else:
+        texts = [page.extract_text() or '' for page in pages]
+
+    # Per-page \r normalization amortizes across short strings instead
+    # of one large rewrite later in normalize_text
+    return '\n'.join(
+        text.replace('\r\n', '\n').replace('\r', '\n')
+        for text in texts if text.strip()
+    )
+
+
+# Extension-to-extractor dispatch table - a dict lookup instead of an
+# if/elif chain, and the single place to register new formats
+_EXTRACTORS = {
+    'txt': extract_from_txt,
+    'docx': extract_from_docx,
+    'pdf': extract_from_pdf,
+}
+
+
+# Keyed on the 16-byte digest alone, so a probe never hashes or compares
+# the document text itself and only cleaned outputs stay pinned in
+# memory, not the raw inputs
+_NORM_CACHE: "OrderedDict[bytes, str]" = OrderedDict()
+_NORM_CACHE_MAX = 32
 
 
 def normalize_text(text: str) -> str:
@@ -90,44 +356,70 @@ def normalize_text(text: str) -> str:
     - Remove non-printable control characters
     - Normalize whitespace
     - Preserve paragraph breaks
-    
+    Results are memoized on a content digest, since Streamlit reruns
+    re-normalize the same upload repeatedly
+
     Args:
         text: Raw text content
-        
+
     Returns:
         str: Normalized text
     """
-    # Apply NFKC normalization (compatibility decomposition + canonical composition)
-    text = unicodedata.normalize('NFKC', text)
-    
-    # Remove non-printable control characters (except newlines, tabs, carriage returns)
-    text = ''.join(char for char in text if char.isprintable() or char in '\n\t\r')
-    
-    # Normalize newlines to \n
-    text = text.replace('\r\n', '\n').replace('\r', '\n')
-    
-    # Collapse excessive whitespace within lines (preserve paragraph breaks)
-    lines = text.split('\n')
-    lines = [re.sub(r'[ \t]+', ' ', line.strip()) for line in lines]
-    
-    # Preserve paragraph breaks (double newline)
-    text = '\n'.join(lines)
-    
-    # Collapse more than 2 consecutive newlines to 2 (preserve paragraph structure)
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+    cached = _NORM_CACHE.get(digest)
+    if cached is not None:
+        _NORM_CACHE.move_to_end(digest)
+        return cached
+
+    result = _normalize_impl(text)
+    _NORM_CACHE[digest] = result
+    if len(_NORM_CACHE) > _NORM_CACHE_MAX:
+        _NORM_CACHE.popitem(last=False)
+    return result
+
+
+def _normalize_impl(text: str) -> str:
+    """Normalization body behind the digest-keyed cache above"""
+    # Most well-produced documents are already clean; one C-level scan
+    # that stops at the first dirty byte lets them skip the pipeline
+    if text.isascii() and _DIRTY_RE.search(text) is None:
+        return text.strip()
+
+    if text.isascii():
+        # Large ASCII inputs: one native-code pass over the code points
+        # does the entire cleanup when numba is available
+        if _clean_codepoints is not None and len(text) >= _JIT_THRESHOLD:
+            return _jit_clean(text)
+
+        # Otherwise run the same pipeline over the encoded bytes, where
+        # every pass moves a quarter of the data a UCS-4 string would
+        return _ascii_clean(text)
+
+    # Apply NFKC normalization (compatibility decomposition + canonical
+    # composition) - the is_normalized quick-check runs in C with no
+    # allocation, and most well-produced documents are already NFKC
+    if not unicodedata.is_normalized('NFKC', text):
+        text = unicodedata.normalize('NFKC', text)
+
+    # Remove control characters (except newlines, tabs, carriage
+    # returns) in a single translate pass - the old per-character
+    # isprintable() generator dominated this function's runtime
+    text = text.translate(_CTRL_TRANSLATE)
+
+
+    # One fused pass normalizes \r\n and \r to \n, strips whitespace at
+    # line edges and collapses blank-line runs to a single paragraph
+    # break - previously four separate full-string rewrites
+    text = _NL_EDGE_RE.sub(_clean_nl, text)
+
+    # Collapse excessive whitespace within lines - line edges are already
+    # stripped by the pass above, so one flat substitution over the whole
+    # string replaces the old split/collapse-per-line/join round-trip
+    text = _WS_RE.sub(' ', text)
+
     return text.strip()
 
 
-def clean_text(text: str) -> str:
-    """
-    Legacy function - now just calls normalize_text
-    Kept for backwards compatibility
-    
-    Args:
-        text: Raw text content
-        
-    Returns:
-        str: Cleaned text
-    """
-    return normalize_text(text)
+# Legacy name kept for backwards compatibility - bound at import time so
+# callers skip the trampoline frame the old wrapper added per call
+clean_text = normalize_text